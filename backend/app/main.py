@@ -3,11 +3,23 @@ Bialy Backend API - FastAPI application entry point
 
 Time series forecasting and anomaly detection powered by StatsForecast
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 
 from .routers import forecast_router, anomaly_router
+from .services import statsforecast_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up forecasting models before serving traffic (set WARMUP=1)"""
+    if os.getenv("WARMUP") == "1":
+        statsforecast_service.warmup()
+    yield
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -15,7 +27,9 @@ app = FastAPI(
     description="Time series forecasting and anomaly detection using StatsForecast",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # Faster serialization of large numeric payloads
 )
 
 # CORS configuration
@@ -43,6 +57,7 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "forecast": "/api/v1/forecast",
+            "batch_forecast": "/api/v1/forecast/batch",
             "anomaly_detection": "/api/v1/detect-anomalies",
             "models": "/api/v1/models",
             "health": "/api/v1/health"
@@ -67,5 +82,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True  # Enable auto-reload in development
+        loop="auto",  # uvloop/httptools from uvicorn[standard] when available
+        http="auto",
+        reload=os.getenv("ENV") == "dev"  # Auto-reload only in development
     )
@@ -6,7 +6,11 @@ from .forecast import (
     ForecastRequest,
     ForecastResponse,
     ForecastPoint,
-    ForecastMetrics
+    ForecastMetrics,
+    SeriesData,
+    BatchForecastRequest,
+    SeriesForecast,
+    BatchForecastResponse
 )
 from .anomaly import (
     AnomalyRequest,
@@ -15,6 +19,15 @@ from .anomaly import (
     ExpectedRange,
     ConfidenceBand
 )
+from .decoding import (
+    DataPointStruct,
+    ForecastRequestStruct,
+    SeriesDataStruct,
+    BatchForecastRequestStruct,
+    AnomalyRequestStruct,
+    decode_request,
+    request_body_schema
+)
 
 __all__ = [
     'DataPoint',
@@ -22,9 +35,20 @@ __all__ = [
     'ForecastResponse',
     'ForecastPoint',
     'ForecastMetrics',
+    'SeriesData',
+    'BatchForecastRequest',
+    'SeriesForecast',
+    'BatchForecastResponse',
     'AnomalyRequest',
     'AnomalyResponse',
     'AnomalyPoint',
     'ExpectedRange',
-    'ConfidenceBand'
+    'ConfidenceBand',
+    'DataPointStruct',
+    'ForecastRequestStruct',
+    'SeriesDataStruct',
+    'BatchForecastRequestStruct',
+    'AnomalyRequestStruct',
+    'decode_request',
+    'request_body_schema'
 ]
@@ -0,0 +1,128 @@
+"""
+msgspec structs for decoding request bodies
+
+Request bodies are decoded and validated by msgspec in a single C call
+instead of going through Pydantic. The structs mirror the Pydantic request
+models field for field (including constraints); the Pydantic models are
+still used to document the request bodies in the OpenAPI schema.
+
+msgspec is stricter than Pydantic's lax mode: numeric strings such as "1.5"
+are rejected, and `horizon`/`seasonLength` must be JSON integers (30.0 is
+rejected). `confidenceLevels` still accepts integral floats like 95.0, as
+Pydantic did, and coerces them to int.
+"""
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional, Type, TypeVar, Union
+
+import msgspec
+from fastapi.exceptions import RequestValidationError
+from msgspec import Meta
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+
+def _coerce_levels(levels: List[Union[int, float]]) -> List[int]:
+    """Convert confidence levels to int, rejecting fractional values like Pydantic does"""
+    coerced = []
+    for level in levels:
+        if level != int(level):
+            raise ValueError(f"Confidence level must be an integer, got {level}")
+        coerced.append(int(level))
+    return coerced
+
+
+class DataPointStruct(msgspec.Struct):
+    """Single time series data point"""
+    date: str
+    value: float
+
+
+class ForecastRequestStruct(msgspec.Struct):
+    """Request body for forecast endpoint (see ForecastRequest)"""
+    data: Annotated[List[DataPointStruct], Meta(min_length=10)]
+    horizon: Annotated[int, Meta(gt=0, le=365)]
+    model: Literal['auto', 'arima', 'ets', 'theta'] = 'auto'
+    seasonLength: Optional[Annotated[int, Meta(gt=1)]] = None
+    confidenceLevels: List[Union[int, float]] = msgspec.field(default_factory=lambda: [95])
+
+    def __post_init__(self):
+        self.confidenceLevels = _coerce_levels(self.confidenceLevels)
+
+
+class SeriesDataStruct(msgspec.Struct):
+    """Single named time series within a batch request (see SeriesData)"""
+    id: str
+    data: Annotated[List[DataPointStruct], Meta(min_length=10)]
+
+
+class BatchForecastRequestStruct(msgspec.Struct):
+    """Request body for batch forecast endpoint (see BatchForecastRequest)"""
+    series: Annotated[List[SeriesDataStruct], Meta(min_length=1)]
+    horizon: Annotated[int, Meta(gt=0, le=365)]
+    model: Literal['auto', 'arima', 'ets', 'theta'] = 'auto'
+    seasonLength: Optional[Annotated[int, Meta(gt=1)]] = None
+    confidenceLevels: List[Union[int, float]] = msgspec.field(default_factory=lambda: [95])
+
+    def __post_init__(self):
+        self.confidenceLevels = _coerce_levels(self.confidenceLevels)
+
+
+class AnomalyRequestStruct(msgspec.Struct):
+    """Request body for anomaly detection endpoint (see AnomalyRequest)"""
+    data: Annotated[List[DataPointStruct], Meta(min_length=20)]
+    sensitivity: Literal['low', 'medium', 'high'] = 'medium'
+    seasonLength: Optional[Annotated[int, Meta(gt=1)]] = None
+    showConfidenceBands: bool = True
+
+
+@lru_cache(maxsize=None)
+def _get_decoder(request_type: Type[T]) -> msgspec.json.Decoder:
+    """Build (once) a JSON decoder for a request struct"""
+    return msgspec.json.Decoder(request_type)
+
+
+def decode_request(body: bytes, request_type: Type[T]) -> T:
+    """
+    Decode and validate a JSON request body into a request struct
+
+    Raises RequestValidationError (HTTP 422) if the body is invalid, matching
+    FastAPI's behavior for Pydantic request models.
+    """
+    try:
+        return _get_decoder(request_type).decode(body)
+    except msgspec.DecodeError as e:
+        raise RequestValidationError([{
+            'type': 'value_error',
+            'loc': ('body',),
+            'msg': str(e),
+            'input': None
+        }])
+
+
+def request_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    OpenAPI `requestBody` for a route that reads its body manually
+
+    Pass as `openapi_extra` so /docs still shows the Pydantic request model.
+    Nested definitions are inlined since the schema is not registered under
+    components.
+    """
+    schema = model.model_json_schema()
+    definitions = schema.pop('$defs', {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if '$ref' in node:
+                return inline(definitions[node['$ref'].rsplit('/', 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+
+    return {
+        'requestBody': {
+            'required': True,
+            'content': {'application/json': {'schema': inline(schema)}}
+        }
+    }
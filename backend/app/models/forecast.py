@@ -36,6 +36,47 @@ class ForecastRequest(BaseModel):
         }
 
 
+class SeriesData(BaseModel):
+    """Single named time series within a batch request"""
+    id: str = Field(..., description="Series identifier, echoed back in the response")
+    data: List[DataPoint] = Field(..., min_length=10, description="Time series data points (minimum 10 required)")
+
+
+class BatchForecastRequest(BaseModel):
+    """Request model for batch forecast endpoint"""
+    series: List[SeriesData] = Field(..., min_length=1, description="Time series to forecast (must share the same frequency)")
+    horizon: int = Field(..., gt=0, le=365, description="Number of periods to forecast (1-365)")
+    model: Literal['auto', 'arima', 'ets', 'theta'] = Field(default='auto', description="Forecasting model to use")
+    seasonLength: Optional[int] = Field(default=None, gt=1, description="Season length (e.g., 7 for weekly, 12 for monthly)")
+    confidenceLevels: List[int] = Field(default=[95], description="Confidence interval levels (e.g., [90, 95, 99])")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "series": [
+                    {
+                        "id": "revenue",
+                        "data": [
+                            {"date": "2024-01-01", "value": 100.5},
+                            {"date": "2024-01-02", "value": 102.3}
+                        ]
+                    },
+                    {
+                        "id": "signups",
+                        "data": [
+                            {"date": "2024-01-01", "value": 12.0},
+                            {"date": "2024-01-02", "value": 15.0}
+                        ]
+                    }
+                ],
+                "horizon": 30,
+                "model": "ets",
+                "seasonLength": 7,
+                "confidenceLevels": [95]
+            }
+        }
+
+
 class ForecastPoint(BaseModel):
     """Single forecast point"""
     date: str
@@ -89,3 +130,17 @@ class ForecastResponse(BaseModel):
                 }
             }
         }
+
+
+class SeriesForecast(BaseModel):
+    """Forecast for a single series within a batch response"""
+    id: str = Field(..., description="Series identifier from the request")
+    forecast: List[ForecastPoint] = Field(..., description="Forecasted values")
+    confidenceIntervals: dict = Field(..., description="Confidence intervals (upper/lower bounds)")
+
+
+class BatchForecastResponse(BaseModel):
+    """Response model for batch forecast endpoint"""
+    forecasts: List[SeriesForecast] = Field(..., description="Forecasts in request order")
+    modelUsed: str = Field(..., description="Model that was used (e.g., 'AutoETS')")
+    metrics: ForecastMetrics = Field(..., description="Metrics for the whole batch")
@@ -1,20 +1,39 @@
 """
 Forecast API endpoints
 """
-from fastapi import APIRouter, HTTPException
+import os
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
 from typing import Dict
 
-from ..models import ForecastRequest, ForecastResponse
-from ..services import statsforecast_service
+from ..models import (
+    ForecastRequest,
+    ForecastResponse,
+    BatchForecastRequest,
+    BatchForecastResponse,
+    ForecastRequestStruct,
+    BatchForecastRequestStruct,
+    decode_request,
+    request_body_schema
+)
+from ..services import statsforecast_service, forecast_response_cache
 
 router = APIRouter(
     prefix="/api/v1",
     tags=["forecast"]
 )
 
+# How long clients may reuse a forecast response (seconds)
+FORECAST_CACHE_MAX_AGE = int(os.getenv("FORECAST_CACHE_MAX_AGE", "60"))
+
 
-@router.post("/forecast", response_model=ForecastResponse)
-async def generate_forecast(request: ForecastRequest) -> ForecastResponse:
+@router.post(
+    "/forecast",
+    response_model=ForecastResponse,
+    openapi_extra=request_body_schema(ForecastRequest)
+)
+async def generate_forecast(request: Request) -> Response:
     """
     Generate time series forecast using StatsForecast
 
@@ -26,15 +45,63 @@ async def generate_forecast(request: ForecastRequest) -> ForecastResponse:
 
     Returns forecast values with confidence intervals and model diagnostics.
     """
+    # Decode with msgspec rather than a Pydantic body parameter (much faster for large payloads)
+    forecast_request = decode_request(await request.body(), ForecastRequestStruct)
+    cache_headers = {"Cache-Control": f"max-age={FORECAST_CACHE_MAX_AGE}"}
+
+    # Identical requests (e.g. dashboard refreshes) reuse the serialized response.
+    # Cached bodies are replayed byte for byte, including the original
+    # metrics.computation_time_ms of the request that computed them.
+    cache_key = forecast_response_cache.make_key(forecast_request)
+    cached_body = forecast_response_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json", headers=cache_headers)
+
     try:
-        result = statsforecast_service.generate_forecast(request)
-        return result
+        # CPU-bound: run in the threadpool so the event loop stays responsive
+        result = await run_in_threadpool(statsforecast_service.generate_forecast, forecast_request)
+        # Return the response directly: the result is built from trusted values,
+        # so FastAPI's response_model re-validation is skipped
+        response = ORJSONResponse(result.model_dump(), headers=cache_headers)
+        forecast_response_cache.put(cache_key, response.body)
+        return response
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Forecast generation failed: {str(e)}")
 
 
+@router.post(
+    "/forecast/batch",
+    response_model=BatchForecastResponse,
+    openapi_extra=request_body_schema(BatchForecastRequest)
+)
+async def generate_batch_forecast(request: Request) -> Response:
+    """
+    Generate forecasts for multiple time series in a single call
+
+    - **series**: List of series, each with an `id` and its data points
+    - **horizon**, **model**, **seasonLength**, **confidenceLevels**: Same as `/forecast`,
+      applied to every series
+
+    All series must share the same frequency. They are fitted together in one
+    StatsForecast run (across worker processes if BATCH_FORECAST_PARALLEL=1).
+    """
+    # Decode with msgspec rather than a Pydantic body parameter (much faster for large payloads)
+    batch_request = decode_request(await request.body(), BatchForecastRequestStruct)
+
+    try:
+        # CPU-bound: run in the threadpool so the event loop stays responsive
+        result = await run_in_threadpool(statsforecast_service.generate_batch_forecast, batch_request)
+        # Return the response directly: the result is built from trusted values,
+        # so FastAPI's response_model re-validation is skipped
+        return ORJSONResponse(result.model_dump())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch forecast generation failed: {str(e)}")
+
+
 @router.get("/models")
 async def list_available_models() -> Dict:
     """
@@ -2,12 +2,15 @@
 Business logic services
 """
 from .statsforecast_service import statsforecast_service, StatsForecastService
-from .data_processing import prepare_dataframe, infer_frequency, validate_data
+from .response_cache import forecast_response_cache, ResponseCache
+from .data_processing import infer_frequency, validate_data, validate_and_prepare
 
 __all__ = [
     'statsforecast_service',
     'StatsForecastService',
-    'prepare_dataframe',
+    'forecast_response_cache',
+    'ResponseCache',
     'infer_frequency',
-    'validate_data'
+    'validate_data',
+    'validate_and_prepare'
 ]
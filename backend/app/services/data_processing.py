@@ -1,29 +1,35 @@
 """
 Data processing and validation utilities
 """
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import List
-from ..models import DataPoint
+from typing import Sequence, Tuple
+from ..models import DataPointStruct
 
 
-def prepare_dataframe(data: List[DataPoint], unique_id: str = 'series_1') -> pd.DataFrame:
+def validate_and_prepare(data: Sequence[DataPointStruct], unique_id: str = 'series_1') -> pd.DataFrame:
     """
-    Convert list of DataPoint to StatsForecast-compatible DataFrame
+    Validate time series data and convert it to a StatsForecast-compatible DataFrame
 
-    StatsForecast requires columns: unique_id, ds (date), y (value)
+    Reuses the dates and values parsed during validation, so each point is
+    only parsed once. Raises ValueError if data is invalid.
     """
-    df = pd.DataFrame([
-        {
-            'unique_id': unique_id,
-            'ds': pd.to_datetime(point.date),
-            'y': point.value
-        }
-        for point in data
-    ])
-
-    # Sort by date
-    df = df.sort_values('ds').reset_index(drop=True)
+    dates, values = validate_data(data)
+    return _build_dataframe(dates, values, unique_id)
+
+
+def _build_dataframe(dates: pd.DatetimeIndex, values: np.ndarray, unique_id: str) -> pd.DataFrame:
+    """Assemble the unique_id/ds/y DataFrame, sorted by date"""
+    df = pd.DataFrame({
+        'unique_id': unique_id,
+        'ds': dates,
+        'y': values
+    })
+
+    # Sort by date (client series usually arrive sorted, so skip the sort then)
+    if not df['ds'].is_monotonic_increasing:
+        df.sort_values('ds', kind='stable', ignore_index=True, inplace=True)
 
     return df
 
@@ -89,29 +95,31 @@ def auto_detect_season_length(df: pd.DataFrame, freq: str) -> int:
     return freq_to_season.get(freq, 7)  # Default to 7
 
 
-def validate_data(data: List[DataPoint]) -> None:
+def validate_data(data: Sequence[DataPointStruct]) -> Tuple[pd.DatetimeIndex, np.ndarray]:
     """
     Validate time series data
 
+    Returns the parsed dates and values (in input order).
     Raises ValueError if data is invalid
     """
     if len(data) < 2:
         raise ValueError("Need at least 2 data points")
 
-    # Check for NaN or infinite values
-    import math
-    for point in data:
-        if not isinstance(point.value, (int, float)):
-            raise ValueError(f"Invalid value at {point.date}: {point.value}")
-        if math.isnan(point.value) or math.isinf(point.value):
-            raise ValueError(f"Invalid value at {point.date}: {point.value}")
+    # Check for NaN or infinite values (Pydantic already enforces numeric types)
+    values = np.fromiter((point.value for point in data), dtype=np.float64, count=len(data))
+    finite = np.isfinite(values)
+    if not finite.all():
+        bad = data[int(np.argmin(finite))]
+        raise ValueError(f"Invalid value at {bad.date}: {bad.value}")
 
     # Check date parsing
     try:
-        dates = [pd.to_datetime(point.date) for point in data]
+        dates = pd.to_datetime([point.date for point in data], format='ISO8601', errors='raise')
     except Exception as e:
         raise ValueError(f"Invalid date format: {e}")
 
     # Check for duplicate dates
-    if len(dates) != len(set(dates)):
+    if dates.duplicated().any():
         raise ValueError("Duplicate dates found in data")
+
+    return dates, values
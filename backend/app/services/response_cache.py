@@ -0,0 +1,52 @@
+"""
+In-memory LRU cache for serialized API responses
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import msgspec
+
+
+class ResponseCache:
+    """
+    LRU cache mapping request hashes to serialized response bodies
+
+    Not locked: get/put are only called from async handlers on the event loop.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    @staticmethod
+    def make_key(request: msgspec.Struct) -> str:
+        """
+        Hash a decoded request
+
+        Structs encode with a fixed field order, so identical requests hash
+        the same regardless of key order or whitespace in the original body.
+        """
+        return hashlib.blake2b(msgspec.json.encode(request), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key (marking it recently used), or None"""
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a body, evicting the least recently used entry when full"""
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
+
+
+# Cache for /forecast responses (dashboards re-request identical forecasts on refresh)
+forecast_response_cache = ResponseCache(maxsize=128)
@@ -1,6 +1,7 @@
 """
 StatsForecast service for time series forecasting and anomaly detection
 """
+import os
 import time
 import pandas as pd
 import numpy as np
@@ -9,22 +10,24 @@ from statsforecast import StatsForecast
 from statsforecast.models import AutoARIMA, AutoETS, AutoTheta
 
 from ..models import (
-    DataPoint,
-    ForecastRequest,
+    DataPointStruct,
+    ForecastRequestStruct,
     ForecastResponse,
     ForecastPoint,
     ForecastMetrics,
-    AnomalyRequest,
+    BatchForecastRequestStruct,
+    BatchForecastResponse,
+    SeriesForecast,
+    AnomalyRequestStruct,
     AnomalyResponse,
     AnomalyPoint,
     ExpectedRange,
     ConfidenceBand
 )
 from .data_processing import (
-    prepare_dataframe,
     infer_frequency,
     auto_detect_season_length,
-    validate_data
+    validate_and_prepare
 )
 
 
@@ -38,17 +41,35 @@ class StatsForecastService:
         'high': 99     # 99% confidence interval
     }
 
-    def generate_forecast(self, request: ForecastRequest) -> ForecastResponse:
+    # Two-sided z-scores per confidence level, i.e. norm.ppf((1 + level / 100) / 2)
+    Z_SCORES = {
+        90: 1.6448536269514722,
+        95: 1.959963984540054,
+        99: 2.5758293035489004
+    }
+
+    # Deviation thresholds for medium/high severity, adjusted by sensitivity
+    SEVERITY_THRESHOLDS = {
+        'low': np.array([2.0, 3.0]),     # 90% CI - more lenient
+        'medium': np.array([1.5, 2.0]),  # 95% CI
+        'high': np.array([1.0, 1.5])     # 99% CI - very strict
+    }
+    SEVERITY_LEVELS = np.array(['low', 'medium', 'high'])
+
+    # Fit batch series in worker processes (BATCH_FORECAST_PARALLEL=1). Off by
+    # default: StatsForecast forks a fresh process pool per call from a threadpool
+    # worker of the running server, which pays process startup on every request
+    # and can deadlock if another thread holds a lock at fork time.
+    BATCH_PARALLEL = os.getenv("BATCH_FORECAST_PARALLEL") == "1"
+
+    def generate_forecast(self, request: ForecastRequestStruct) -> ForecastResponse:
         """
         Generate forecast using StatsForecast
         """
         start_time = time.time()
 
-        # Validate data
-        validate_data(request.data)
-
-        # Prepare data
-        df = prepare_dataframe(request.data)
+        # Validate and prepare data
+        df = validate_and_prepare(request.data)
         freq = infer_frequency(df)
 
         # Determine season length
@@ -57,14 +78,7 @@ class StatsForecastService:
             season_length = auto_detect_season_length(df, freq)
 
         # Select model
-        model, model_name = self._select_model(request.model, season_length)
-
-        # Initialize StatsForecast
-        sf = StatsForecast(
-            models=[model],
-            freq=freq,
-            n_jobs=1  # Single job to avoid multiprocessing issues in API
-        )
+        sf, model_name = self._build_statsforecast(request.model, season_length, freq)
 
         # Fit and forecast
         forecasts_df = sf.forecast(
@@ -82,21 +96,100 @@ class StatsForecastService:
 
         # Calculate metrics
         computation_time = (time.time() - start_time) * 1000  # Convert to ms
-        metrics = ForecastMetrics(
+        metrics = ForecastMetrics.model_construct(
             aic=None,  # StatsForecast doesn't always expose AIC/BIC
             bic=None,
             mape=None,  # Would need historical validation
             computation_time_ms=computation_time
         )
 
-        return ForecastResponse(
+        # Response objects are built with model_construct(): every field comes from
+        # values computed here, so re-running Pydantic validation is pure overhead.
+        # Untrusted input is still validated when the request is decoded.
+        return ForecastResponse.model_construct(
             forecast=forecast_points,
             confidenceIntervals=confidence_intervals,
             modelUsed=model_name,
             metrics=metrics
         )
 
-    def detect_anomalies(self, request: AnomalyRequest) -> AnomalyResponse:
+    def generate_batch_forecast(self, request: BatchForecastRequestStruct) -> BatchForecastResponse:
+        """
+        Generate forecasts for several series in one StatsForecast call
+
+        All series are fitted together in one call instead of one HTTP call
+        per series, optionally across worker processes (see BATCH_PARALLEL).
+        """
+        start_time = time.time()
+
+        series_ids = [series.id for series in request.series]
+        if len(series_ids) != len(set(series_ids)):
+            raise ValueError("Duplicate series ids found in batch")
+
+        # Validate and prepare each series
+        frames = []
+        for series in request.series:
+            try:
+                frames.append(validate_and_prepare(series.data, unique_id=series.id))
+            except ValueError as e:
+                raise ValueError(f"Series '{series.id}': {e}")
+
+        # A single StatsForecast call needs one frequency for every series
+        freqs = {infer_frequency(frame) for frame in frames}
+        if len(freqs) > 1:
+            raise ValueError(f"All series must share the same frequency, found: {sorted(freqs)}")
+        freq = freqs.pop()
+
+        df = pd.concat(frames, ignore_index=True)
+
+        # Determine season length
+        season_length = request.seasonLength
+        if season_length is None:
+            season_length = auto_detect_season_length(df, freq)
+
+        # Never start more workers than there are series to fit
+        n_jobs = 1
+        if self.BATCH_PARALLEL:
+            n_jobs = min(len(frames), max(1, (os.cpu_count() or 1) // 2))
+        sf, model_name = self._build_statsforecast(request.model, season_length, freq, n_jobs)
+
+        forecasts_df = sf.forecast(
+            df=df,
+            h=request.horizon,
+            level=request.confidenceLevels
+        )
+
+        # Split results back out per series, in request order
+        grouped = dict(tuple(forecasts_df.groupby('unique_id', sort=False)))
+        forecasts = []
+        for series_id in series_ids:
+            forecast_points, confidence_intervals = self._extract_forecast_data(
+                grouped[series_id],
+                model_name,
+                request.confidenceLevels
+            )
+            forecasts.append(SeriesForecast.model_construct(
+                id=series_id,
+                forecast=forecast_points,
+                confidenceIntervals=confidence_intervals
+            ))
+
+        # Calculate metrics
+        computation_time = (time.time() - start_time) * 1000  # Convert to ms
+        metrics = ForecastMetrics.model_construct(
+            aic=None,
+            bic=None,
+            mape=None,
+            computation_time_ms=computation_time
+        )
+
+        return BatchForecastResponse.model_construct(
+            forecasts=forecasts,
+            modelUsed=model_name,
+            metrics=metrics
+        )
+
+    def detect_anomalies(self, request: AnomalyRequestStruct) -> AnomalyResponse:
         """
         Detect anomalies using prediction intervals
 
@@ -105,11 +198,8 @@ class StatsForecastService:
         """
         start_time = time.time()
 
-        # Validate data
-        validate_data(request.data)
-
-        # Prepare data
-        df = prepare_dataframe(request.data)
+        # Validate and prepare data
+        df = validate_and_prepare(request.data)
         freq = infer_frequency(df)
 
         # Determine season length
@@ -120,23 +210,14 @@ class StatsForecastService:
         # Get confidence level based on sensitivity
         confidence_level = self.SENSITIVITY_MAP[request.sensitivity]
 
-        # Use AutoETS for anomaly detection (fast and robust)
-        model = AutoETS(season_length=season_length)
+        # Bounds are labelled as AutoETS for API compatibility
         model_name = 'AutoETS'
 
-        # Initialize StatsForecast
-        sf = StatsForecast(
-            models=[model],
-            freq=freq,
-            n_jobs=1
-        )
-
         # Statistical anomaly detection using confidence intervals
         # This is simpler and works well for most cases
-        from scipy import stats
 
-        result_df = df.copy()
-        values = df['y'].values
+        # Kept in float64: values are echoed back to the client
+        values = df['y'].to_numpy(dtype=np.float64)
 
         # Use rolling statistics for better local anomaly detection
         window = min(season_length * 2, len(values))
@@ -144,78 +225,102 @@ class StatsForecastService:
             window = len(values)
 
         # Calculate rolling mean and std
-        rolling_mean = pd.Series(values).rolling(window=window, center=True, min_periods=1).mean()
-        rolling_std = pd.Series(values).rolling(window=window, center=True, min_periods=1).std()
+        rolling_mean, rolling_std = self._rolling_mean_std(values, window)
 
         # Calculate z-score for confidence level
-        z_score = stats.norm.ppf((1 + confidence_level / 100) / 2)
-
-        # Create prediction bounds
-        result_df[f'{model_name}-lo-{confidence_level}'] = rolling_mean - z_score * rolling_std
-        result_df[f'{model_name}-hi-{confidence_level}'] = rolling_mean + z_score * rolling_std
+        z_score = self.Z_SCORES[confidence_level]
+
+        # Create prediction bounds as arrays (NaN where the window has no spread yet)
+        half_width = z_score * rolling_std
+        lower = rolling_mean - half_width
+        upper = rolling_mean + half_width
+        valid = np.isfinite(half_width)
+
+        # Format dates once for the whole series (C-level datetime64 -> 'YYYY-MM-DD')
+        dates_str = df['ds'].to_numpy().astype('datetime64[D]').astype(str)
+
+        # Create confidence bands
+        # Rows without bounds are masked out up front; tolist() yields Python floats
+        confidence_bands = None
+        if request.showConfidenceBands:
+            confidence_bands = [
+                ConfidenceBand.model_construct(date=date_str, lower=lower_bound, upper=upper_bound)
+                for date_str, lower_bound, upper_bound in zip(
+                    dates_str[valid].tolist(), lower[valid].tolist(), upper[valid].tolist()
+                )
+            ]
 
         # Detect anomalies (values outside prediction intervals)
-        lower_col = f'{model_name}-lo-{confidence_level}'
-        upper_col = f'{model_name}-hi-{confidence_level}'
+        anomaly_idx = np.flatnonzero(valid & ((values < lower) | (values > upper)))
+
+        # Calculate deviation in standard deviations, only for the flagged points
+        anomaly_half_width = half_width[anomaly_idx]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            deviation = np.where(
+                anomaly_half_width > 0,
+                np.abs(values[anomaly_idx] - rolling_mean[anomaly_idx]) / anomaly_half_width,
+                0.0
+            )
+
+        # Determine severity for all flagged points at once
+        severities = self._determine_severity(deviation, request.sensitivity)
 
+        # Gather the flagged rows once as Python scalars instead of indexing per field
         anomalies = []
-        confidence_bands = []
-
-        for _, row in result_df.iterrows():
-            date_str = row['ds'].strftime('%Y-%m-%d')
-            actual_value = row['y']
-
-            # Get prediction bounds (might be NaN for first few points)
-            lower_bound = row.get(lower_col, np.nan)
-            upper_bound = row.get(upper_col, np.nan)
-
-            # Create confidence band
-            if not pd.isna(lower_bound) and not pd.isna(upper_bound):
-                if request.showConfidenceBands:
-                    confidence_bands.append(ConfidenceBand(
-                        date=date_str,
-                        lower=float(lower_bound),
-                        upper=float(upper_bound)
-                    ))
-
-                # Check if value is outside bounds (anomaly)
-                if actual_value < lower_bound or actual_value > upper_bound:
-                    # Calculate deviation in standard deviations
-                    range_size = upper_bound - lower_bound
-                    mid_point = (upper_bound + lower_bound) / 2
-                    deviation = abs(actual_value - mid_point) / (range_size / 2) if range_size > 0 else 0
-
-                    # Determine severity
-                    severity = self._determine_severity(deviation, request.sensitivity)
-
-                    anomalies.append(AnomalyPoint(
-                        date=date_str,
-                        value=float(actual_value),
-                        severity=severity,
-                        expectedRange=ExpectedRange(
-                            lower=float(lower_bound),
-                            upper=float(upper_bound)
-                        ),
-                        deviation=float(deviation)
-                    ))
+        for date_str, actual_value, lower_bound, upper_bound, anomaly_deviation, severity in zip(
+            dates_str[anomaly_idx].tolist(),
+            values[anomaly_idx].tolist(),
+            lower[anomaly_idx].tolist(),
+            upper[anomaly_idx].tolist(),
+            deviation.tolist(),
+            severities.tolist()
+        ):
+            anomalies.append(AnomalyPoint.model_construct(
+                date=date_str,
+                value=actual_value,
+                severity=severity,
+                expectedRange=ExpectedRange.model_construct(
+                    lower=lower_bound,
+                    upper=upper_bound
+                ),
+                deviation=anomaly_deviation
+            ))
 
         # Calculate metrics
-        total_points = len(result_df)
+        total_points = len(df)
         anomaly_count = len(anomalies)
         anomaly_rate = anomaly_count / total_points if total_points > 0 else 0
         computation_time = (time.time() - start_time) * 1000
 
-        return AnomalyResponse(
+        return AnomalyResponse.model_construct(
             anomalies=anomalies,
             totalPoints=total_points,
             anomalyCount=anomaly_count,
             anomalyRate=anomaly_rate,
-            confidenceBands=confidence_bands if request.showConfidenceBands else None,
+            confidenceBands=confidence_bands,
             modelUsed=model_name,
             sensitivity=request.sensitivity,
             computationTimeMs=computation_time
         )
 
+    def warmup(self) -> None:
+        """
+        Run tiny synthetic requests through every model
+
+        The first StatsForecast fit per model pays for numba compilation and
+        lazy imports; doing it at startup keeps that off the first user request.
+        """
+        dates = pd.date_range('2024-01-01', periods=30, freq='D').strftime('%Y-%m-%d')
+        data = [
+            DataPointStruct(date=date, value=100.0 + (i % 7) + 0.1 * i)
+            for i, date in enumerate(dates)
+        ]
+
+        for model_type in ('auto', 'ets', 'theta'):  # 'auto' runs AutoARIMA
+            self.generate_forecast(ForecastRequestStruct(data=data, horizon=7, model=model_type))
+
+        self.detect_anomalies(AnomalyRequestStruct(data=data))
+
     def _select_model(self, model_type: str, season_length: int):
         """Select StatsForecast model based on request"""
         if model_type == 'arima' or model_type == 'auto':
@@ -234,6 +339,29 @@ class StatsForecastService:
 
         return model, model_name
 
+    def _build_statsforecast(
+        self,
+        model_type: str,
+        season_length: int,
+        freq: str,
+        n_jobs: int = 1
+    ) -> Tuple[StatsForecast, str]:
+        """
+        Build a StatsForecast wrapper for a model configuration
+
+        A fresh wrapper per request: forecast() stores per-call state on it, and
+        construction is negligible next to the fit, so nothing is shared.
+        """
+        model, model_name = self._select_model(model_type, season_length)
+
+        sf = StatsForecast(
+            models=[model],
+            freq=freq,
+            n_jobs=n_jobs  # Single job unless fitting a batch of series
+        )
+
+        return sf, model_name
+
     def _extract_forecast_data(
         self,
         forecasts_df: pd.DataFrame,
@@ -241,56 +369,42 @@ class StatsForecastService:
         confidence_levels: List[int]
     ) -> Tuple[List[ForecastPoint], Dict]:
         """Extract forecast points and confidence intervals from DataFrame"""
-        forecast_points = []
-        confidence_intervals = {}
+        # Pull columns once instead of materializing a Series per row
+        dates_str = forecasts_df['ds'].to_numpy().astype('datetime64[D]').astype(str).tolist()
+        values = forecasts_df[model_name].to_numpy(dtype=float)
 
-        for _, row in forecasts_df.iterrows():
-            # Main forecast value
-            forecast_value = row[model_name]
-            date_str = row['ds'].strftime('%Y-%m-%d')
-
-            forecast_points.append(ForecastPoint(
-                date=date_str,
-                value=float(forecast_value)
-            ))
+        forecast_points = [
+            ForecastPoint.model_construct(date=date_str, value=float(forecast_value))
+            for date_str, forecast_value in zip(dates_str, values)
+        ]
 
         # Extract confidence intervals
+        confidence_intervals = {}
         for level in confidence_levels:
             upper_col = f'{model_name}-hi-{level}'
             lower_col = f'{model_name}-lo-{level}'
 
             if upper_col in forecasts_df.columns:
-                confidence_intervals[f'upper_{level}'] = forecasts_df[upper_col].tolist()
-                confidence_intervals[f'lower_{level}'] = forecasts_df[lower_col].tolist()
+                confidence_intervals[f'upper_{level}'] = forecasts_df[upper_col].to_numpy(dtype=float).tolist()
+                confidence_intervals[f'lower_{level}'] = forecasts_df[lower_col].to_numpy(dtype=float).tolist()
 
         return forecast_points, confidence_intervals
 
-    def _determine_severity(self, deviation: float, sensitivity: str) -> str:
-        """Determine anomaly severity based on deviation"""
-        # Higher deviation = higher severity
-        # Adjust thresholds based on sensitivity
-
-        if sensitivity == 'low':  # 90% CI - more lenient
-            if deviation > 3:
-                return 'high'
-            elif deviation > 2:
-                return 'medium'
-            else:
-                return 'low'
-        elif sensitivity == 'medium':  # 95% CI
-            if deviation > 2:
-                return 'high'
-            elif deviation > 1.5:
-                return 'medium'
-            else:
-                return 'low'
-        else:  # high sensitivity (99% CI) - very strict
-            if deviation > 1.5:
-                return 'high'
-            elif deviation > 1:
-                return 'medium'
-            else:
-                return 'low'
+    def _rolling_mean_std(self, values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Centered rolling mean and sample std (ddof=1) with partial windows at the edges
+
+        Std is NaN where a window holds a single point.
+        """
+        rolling = pd.Series(values).rolling(window=window, center=True, min_periods=1)
+        return rolling.mean().to_numpy(), rolling.std().to_numpy()
+
+    def _determine_severity(self, deviation: np.ndarray, sensitivity: str) -> np.ndarray:
+        """Determine anomaly severity for each deviation"""
+        # Higher deviation = higher severity; a deviation must exceed a
+        # threshold to reach the next level (side='left')
+        thresholds = self.SEVERITY_THRESHOLDS[sensitivity]
+        return self.SEVERITY_LEVELS[np.searchsorted(thresholds, deviation, side='left')]
 
 
 # Global service instance
@@ -0,0 +1,70 @@
+"""
+Tests for msgspec request decoding
+"""
+import json
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import AnomalyRequestStruct, ForecastRequestStruct, decode_request
+
+
+def _data(points: int) -> list:
+    return [{"date": f"2024-01-{day:02d}", "value": float(day)} for day in range(1, points + 1)]
+
+
+def _body(**overrides) -> bytes:
+    return json.dumps({"data": _data(10), "horizon": 5, **overrides}).encode()
+
+
+def _anomaly_body(**overrides) -> bytes:
+    return json.dumps({"data": _data(20), **overrides}).encode()
+
+
+def test_integral_float_confidence_levels_are_coerced_to_int():
+    request = decode_request(_body(confidenceLevels=[95.0, 99]), ForecastRequestStruct)
+
+    assert request.confidenceLevels == [95, 99]
+    assert all(type(level) is int for level in request.confidenceLevels)
+
+
+def test_fractional_confidence_levels_are_rejected():
+    with pytest.raises(RequestValidationError):
+        decode_request(_body(confidenceLevels=[95.5]), ForecastRequestStruct)
+
+
+def test_valid_bodies_decode():
+    assert decode_request(_body(horizon=365, seasonLength=2), ForecastRequestStruct).horizon == 365
+    assert decode_request(_anomaly_body(seasonLength=2), AnomalyRequestStruct).seasonLength == 2
+
+
+@pytest.mark.parametrize("overrides", [
+    {"data": _data(9)},
+    {"horizon": 0},
+    {"horizon": 366},
+    {"seasonLength": 1},
+    {"model": "prophet"},
+])
+def test_invalid_forecast_request_is_rejected(overrides):
+    with pytest.raises(RequestValidationError):
+        decode_request(_body(**overrides), ForecastRequestStruct)
+
+
+@pytest.mark.parametrize("overrides", [
+    {"data": _data(19)},
+    {"seasonLength": 1},
+    {"sensitivity": "extreme"},
+])
+def test_invalid_anomaly_request_is_rejected(overrides):
+    with pytest.raises(RequestValidationError):
+        decode_request(_anomaly_body(**overrides), AnomalyRequestStruct)
+
+
+def test_invalid_body_returns_422():
+    client = TestClient(app)
+
+    response = client.post("/api/v1/forecast", content=_body(horizon=0))
+
+    assert response.status_code == 422
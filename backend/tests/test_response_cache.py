@@ -0,0 +1,67 @@
+"""
+Tests for the forecast response cache
+"""
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers.forecast import FORECAST_CACHE_MAX_AGE
+from app.services import ResponseCache, forecast_response_cache, statsforecast_service
+
+
+def test_put_evicts_least_recently_used_entry_at_maxsize():
+    cache = ResponseCache(maxsize=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    cache.put('c', b'3')
+
+    assert cache.get('a') is None
+    assert cache.get('b') == b'2'
+    assert cache.get('c') == b'3'
+
+
+def test_get_marks_entry_as_recently_used():
+    cache = ResponseCache(maxsize=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+
+    assert cache.get('a') == b'1'
+    cache.put('c', b'3')
+
+    assert cache.get('a') == b'1'
+    assert cache.get('b') is None
+
+
+@pytest.fixture
+def client():
+    forecast_response_cache.clear()
+    yield TestClient(app)
+    forecast_response_cache.clear()
+
+
+def test_repeated_forecast_is_served_from_cache(client, monkeypatch):
+    calls = []
+    original = statsforecast_service.generate_forecast
+
+    def counting_forecast(request):
+        calls.append(request)
+        return original(request)
+
+    monkeypatch.setattr(statsforecast_service, 'generate_forecast', counting_forecast)
+
+    dates = pd.date_range('2024-01-01', periods=30, freq='D').strftime('%Y-%m-%d')
+    body = {
+        'data': [{'date': date, 'value': float(i % 7)} for i, date in enumerate(dates)],
+        'horizon': 5,
+        'model': 'ets'
+    }
+
+    first = client.post('/api/v1/forecast', json=body)
+    second = client.post('/api/v1/forecast', json=body)
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert second.headers['cache-control'] == f'max-age={FORECAST_CACHE_MAX_AGE}'
+    assert second.headers['content-type'] == 'application/json'
+    assert len(calls) == 1
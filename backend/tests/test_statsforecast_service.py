@@ -0,0 +1,126 @@
+"""
+Tests for the StatsForecast service
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models import (
+    AnomalyRequestStruct,
+    BatchForecastRequestStruct,
+    DataPointStruct,
+    ForecastRequestStruct,
+    SeriesDataStruct
+)
+from app.services import statsforecast_service
+
+
+def _request(seed: int) -> ForecastRequestStruct:
+    dates = pd.date_range('2024-01-01', periods=60, freq='D').strftime('%Y-%m-%d')
+    values = 100 + 10 * np.sin(np.arange(60) * 2 * np.pi / 7) + np.random.default_rng(seed).normal(0, 2, 60)
+    data = [DataPointStruct(date=date, value=float(value)) for date, value in zip(dates, values)]
+    return ForecastRequestStruct(data=data, horizon=14, model='auto', confidenceLevels=[95])
+
+
+def test_concurrent_forecasts_with_same_config_are_independent():
+    # Route handlers run the service in a threadpool, so same-config requests
+    # must not share StatsForecast state
+    requests = [_request(seed) for seed in range(4)]
+    expected = [statsforecast_service.generate_forecast(request) for request in requests]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(statsforecast_service.generate_forecast, requests * 2))
+
+    for result, reference in zip(results, expected * 2):
+        assert result.forecast == reference.forecast
+        assert result.confidenceIntervals == reference.confidenceIntervals
+
+
+def _series(series_id: str, periods: int, freq: str = 'D', seed: int = 0) -> SeriesDataStruct:
+    dates = pd.date_range('2024-01-01', periods=periods, freq=freq).strftime('%Y-%m-%d')
+    values = 100 + np.random.default_rng(seed).normal(0, 2, periods)
+    data = [DataPointStruct(date=date, value=float(value)) for date, value in zip(dates, values)]
+    return SeriesDataStruct(id=series_id, data=data)
+
+
+def _batch(*series: SeriesDataStruct) -> BatchForecastRequestStruct:
+    return BatchForecastRequestStruct(series=list(series), horizon=5, model='ets')
+
+
+def test_batch_forecast_returns_series_in_request_order():
+    series = [_series('zeta', 40, seed=1), _series('alpha', 25, seed=2), _series('mid', 60, seed=3)]
+
+    result = statsforecast_service.generate_batch_forecast(_batch(*series))
+
+    assert [forecast.id for forecast in result.forecasts] == ['zeta', 'alpha', 'mid']
+    for forecast, single in zip(result.forecasts, series):
+        reference = statsforecast_service.generate_forecast(
+            ForecastRequestStruct(data=single.data, horizon=5, model='ets')
+        )
+        assert forecast.forecast == reference.forecast
+        assert forecast.confidenceIntervals == reference.confidenceIntervals
+
+
+def test_batch_forecast_rejects_duplicate_ids():
+    with pytest.raises(ValueError, match="Duplicate series ids"):
+        statsforecast_service.generate_batch_forecast(_batch(_series('a', 20), _series('a', 30)))
+
+
+def test_batch_forecast_rejects_mixed_frequencies():
+    with pytest.raises(ValueError, match="same frequency"):
+        statsforecast_service.generate_batch_forecast(
+            _batch(_series('daily', 30), _series('monthly', 30, freq='MS'))
+        )
+
+
+def test_batch_forecast_validation_error_names_the_series():
+    bad = _series('broken', 20)
+    bad.data.append(bad.data[0])
+
+    with pytest.raises(ValueError, match="Series 'broken': Duplicate dates"):
+        statsforecast_service.generate_batch_forecast(_batch(_series('ok', 20), bad))
+
+
+def test_rolling_mean_std_uses_centered_windows_truncated_at_edges():
+    values = np.array([1.0, 2.0, 4.0, 8.0, 16.0])
+
+    # Odd window: one point either side
+    mean, std = statsforecast_service._rolling_mean_std(values, 3)
+    windows = [[1, 2], [1, 2, 4], [2, 4, 8], [4, 8, 16], [8, 16]]
+    np.testing.assert_allclose(mean, [np.mean(w) for w in windows])
+    np.testing.assert_allclose(std, [np.std(w, ddof=1) for w in windows])
+
+    # Even window: two points before, one after
+    mean, std = statsforecast_service._rolling_mean_std(values, 4)
+    windows = [[1, 2], [1, 2, 4], [1, 2, 4, 8], [2, 4, 8, 16], [4, 8, 16]]
+    np.testing.assert_allclose(mean, [np.mean(w) for w in windows])
+    np.testing.assert_allclose(std, [np.std(w, ddof=1) for w in windows])
+
+
+def test_rolling_std_is_nan_for_single_point_windows():
+    mean, std = statsforecast_service._rolling_mean_std(np.array([3.0, 5.0, 7.0]), 1)
+
+    np.testing.assert_array_equal(mean, [3.0, 5.0, 7.0])
+    assert np.isnan(std).all()
+
+
+def test_rolling_stats_are_exact_on_flat_runs():
+    values = np.r_[np.zeros(20), np.full(20, 12345.678)]
+
+    mean, std = statsforecast_service._rolling_mean_std(values, 4)
+
+    np.testing.assert_array_equal(mean[:18], 0.0)
+    np.testing.assert_array_equal(std[:18], 0.0)
+    np.testing.assert_array_equal(mean[-18:], 12345.678)
+    np.testing.assert_array_equal(std[-18:], 0.0)
+
+
+def test_flat_series_has_no_anomalies():
+    dates = pd.date_range('2024-01-01', periods=365, freq='D').strftime('%Y-%m-%d')
+    data = [DataPointStruct(date=date, value=0.0) for date in dates]
+
+    result = statsforecast_service.detect_anomalies(AnomalyRequestStruct(data=data))
+
+    assert result.anomalyCount == 0